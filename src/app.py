@@ -25,55 +25,55 @@ activities = {
         "description": "Learn strategies and compete in chess tournaments",
         "schedule": "Fridays, 3:30 PM - 5:00 PM",
         "max_participants": 12,
-        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+        "participants": dict.fromkeys(["michael@mergington.edu", "daniel@mergington.edu"])
     },
     "Programming Class": {
         "description": "Learn programming fundamentals and build software projects",
         "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
         "max_participants": 20,
-        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+        "participants": dict.fromkeys(["emma@mergington.edu", "sophia@mergington.edu"])
     },
     "Gym Class": {
         "description": "Physical education and sports activities",
         "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
         "max_participants": 30,
-        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+        "participants": dict.fromkeys(["john@mergington.edu", "olivia@mergington.edu"])
     },
     "Basketball Team": {
         "description": "Competitive basketball training and games",
         "schedule": "Mondays and Wednesdays, 4:00 PM - 5:30 PM",
         "max_participants": 15,
-        "participants": ["alex@mergington.edu"]
+        "participants": dict.fromkeys(["alex@mergington.edu"])
     },
     "Track and Field": {
         "description": "Running, jumping, and throwing events",
         "schedule": "Tuesdays and Thursdays, 3:45 PM - 5:15 PM",
         "max_participants": 25,
-        "participants": ["sarah@mergington.edu", "james@mergington.edu"]
+        "participants": dict.fromkeys(["sarah@mergington.edu", "james@mergington.edu"])
     },
     "Art Studio": {
         "description": "Painting, drawing, and sculpture techniques",
         "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
         "max_participants": 18,
-        "participants": ["lucy@mergington.edu"]
+        "participants": dict.fromkeys(["lucy@mergington.edu"])
     },
     "Music Ensemble": {
         "description": "Orchestra and band performances",
         "schedule": "Mondays and Fridays, 4:00 PM - 5:00 PM",
         "max_participants": 22,
-        "participants": ["david@mergington.edu", "grace@mergington.edu"]
+        "participants": dict.fromkeys(["david@mergington.edu", "grace@mergington.edu"])
     },
     "Debate Club": {
         "description": "Develop argumentation and public speaking skills",
         "schedule": "Thursdays, 3:30 PM - 5:00 PM",
         "max_participants": 16,
-        "participants": ["maya@mergington.edu"]
+        "participants": dict.fromkeys(["maya@mergington.edu"])
     },
     "Science Olympiad": {
         "description": "Compete in science competitions and experiments",
         "schedule": "Tuesdays, 3:30 PM - 5:00 PM",
         "max_participants": 14,
-        "participants": ["ryan@mergington.edu", "jessica@mergington.edu"]
+        "participants": dict.fromkeys(["ryan@mergington.edu", "jessica@mergington.edu"])
     }
 }
 
@@ -85,7 +85,12 @@ def root():
 
 @app.get("/activities")
 def get_activities():
-    return activities
+    # Participants are stored as dict keys for fast membership checks while
+    # keeping signup order; emit them as lists in that order
+    return {
+        name: {**details, "participants": list(details["participants"])}
+        for name, details in activities.items()
+    }
 
 
 @app.post("/activities/{activity_name}/signup")
@@ -103,7 +108,7 @@ def signup_for_activity(activity_name: str, email: str):
     activity = activities[activity_name]
 
     # Add student
-    activity["participants"].append(email)
+    activity["participants"][email] = None
     return {"message": f"Signed up {email} for {activity_name}"}
 
 
@@ -121,5 +126,5 @@ def remove_participant(activity_name: str, email: str):
         raise HTTPException(status_code=404, detail="Participant not found in this activity")
 
     # Remove participant
-    activity["participants"].remove(email)
+    del activity["participants"][email]
     return {"message": f"Removed {email} from {activity_name}"}
@@ -2,161 +2,191 @@
 Tests for the Mergington High School Activities API
 """
 
+import asyncio
+
 import pytest
-from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
 from src.app import app, activities
 
 
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
+# Initial state of the in-memory database, restored before each test.
+# Participants are tuples so the template itself can never be mutated.
+_ORIGINAL_ACTIVITIES = {
+    "Chess Club": {
+        "description": "Learn strategies and compete in chess tournaments",
+        "schedule": "Fridays, 3:30 PM - 5:00 PM",
+        "max_participants": 12,
+        "participants": ("michael@mergington.edu", "daniel@mergington.edu")
+    },
+    "Programming Class": {
+        "description": "Learn programming fundamentals and build software projects",
+        "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
+        "max_participants": 20,
+        "participants": ("emma@mergington.edu", "sophia@mergington.edu")
+    },
+    "Gym Class": {
+        "description": "Physical education and sports activities",
+        "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
+        "max_participants": 30,
+        "participants": ("john@mergington.edu", "olivia@mergington.edu")
+    },
+    "Basketball Team": {
+        "description": "Competitive basketball training and games",
+        "schedule": "Mondays and Wednesdays, 4:00 PM - 5:30 PM",
+        "max_participants": 15,
+        "participants": ("alex@mergington.edu",)
+    },
+    "Track and Field": {
+        "description": "Running, jumping, and throwing events",
+        "schedule": "Tuesdays and Thursdays, 3:45 PM - 5:15 PM",
+        "max_participants": 25,
+        "participants": ("sarah@mergington.edu", "james@mergington.edu")
+    },
+    "Art Studio": {
+        "description": "Painting, drawing, and sculpture techniques",
+        "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
+        "max_participants": 18,
+        "participants": ("lucy@mergington.edu",)
+    },
+    "Music Ensemble": {
+        "description": "Orchestra and band performances",
+        "schedule": "Mondays and Fridays, 4:00 PM - 5:00 PM",
+        "max_participants": 22,
+        "participants": ("david@mergington.edu", "grace@mergington.edu")
+    },
+    "Debate Club": {
+        "description": "Develop argumentation and public speaking skills",
+        "schedule": "Thursdays, 3:30 PM - 5:00 PM",
+        "max_participants": 16,
+        "participants": ("maya@mergington.edu",)
+    },
+    "Science Olympiad": {
+        "description": "Compete in science competitions and experiments",
+        "schedule": "Tuesdays, 3:30 PM - 5:00 PM",
+        "max_participants": 14,
+        "participants": ("ryan@mergington.edu", "jessica@mergington.edu")
+    }
+}
 
+# Pre-encoded Chess Club URLs, so the space in the name is not re-quoted
+# on every request
+_CHESS_URL = "/activities/Chess%20Club"
+_CHESS_SIGNUP_URL = f"{_CHESS_URL}/signup"
+_CHESS_PARTICIPANT_URL_TMPL = _CHESS_URL + "/participants/{email}"
 
-@pytest.fixture(autouse=True)
-def reset_activities():
-    """Reset activities to initial state before each test"""
-    # Store original activities
-    original_activities = {
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        },
-        "Basketball Team": {
-            "description": "Competitive basketball training and games",
-            "schedule": "Mondays and Wednesdays, 4:00 PM - 5:30 PM",
-            "max_participants": 15,
-            "participants": ["alex@mergington.edu"]
-        },
-        "Track and Field": {
-            "description": "Running, jumping, and throwing events",
-            "schedule": "Tuesdays and Thursdays, 3:45 PM - 5:15 PM",
-            "max_participants": 25,
-            "participants": ["sarah@mergington.edu", "james@mergington.edu"]
-        },
-        "Art Studio": {
-            "description": "Painting, drawing, and sculpture techniques",
-            "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 18,
-            "participants": ["lucy@mergington.edu"]
-        },
-        "Music Ensemble": {
-            "description": "Orchestra and band performances",
-            "schedule": "Mondays and Fridays, 4:00 PM - 5:00 PM",
-            "max_participants": 22,
-            "participants": ["david@mergington.edu", "grace@mergington.edu"]
-        },
-        "Debate Club": {
-            "description": "Develop argumentation and public speaking skills",
-            "schedule": "Thursdays, 3:30 PM - 5:00 PM",
-            "max_participants": 16,
-            "participants": ["maya@mergington.edu"]
-        },
-        "Science Olympiad": {
-            "description": "Compete in science competitions and experiments",
-            "schedule": "Tuesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 14,
-            "participants": ["ryan@mergington.edu", "jessica@mergington.edu"]
-        }
-    }
-    
-    # Clear and reset activities
-    activities.clear()
-    for name, details in original_activities.items():
-        activities[name] = details.copy()
-        activities[name]["participants"] = details["participants"].copy()
-    
-    yield
-    
-    # Reset after test
+
+def _restore_activities(baseline):
+    """Restore the in-memory database from the given baseline"""
     activities.clear()
-    for name, details in original_activities.items():
-        activities[name] = details.copy()
-        activities[name]["participants"] = details["participants"].copy()
+    activities.update({
+        name: {**details, "participants": dict.fromkeys(details["participants"])}
+        for name, details in baseline.items()
+    })
+
+
+@pytest.fixture(scope="session")
+async def client():
+    """Create an async client for the FastAPI app, shared across the session"""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+
+
+@pytest.fixture(scope="session")
+def baseline_activities():
+    """Provide the immutable initial activities baseline"""
+    return _ORIGINAL_ACTIVITIES
 
 
+@pytest.fixture(autouse=True)
+def reset_activities(request, baseline_activities):
+    """Reset activities to initial state before each test
+
+    Tests marked readonly share one class-level snapshot instead.
+    """
+    if request.node.get_closest_marker("readonly"):
+        request.getfixturevalue("class_activities")
+        return
+    _restore_activities(baseline_activities)
+
+
+@pytest.fixture(scope="class")
+def class_activities(baseline_activities):
+    """Reset activities once for a class of read-only tests"""
+    _restore_activities(baseline_activities)
+
+
+@pytest.fixture(scope="class")
+async def activities_response(client, class_activities):
+    """Fetch GET /activities once for a class of read-only tests"""
+    response = await client.get("/activities")
+    return response.json()
+
+
+@pytest.mark.readonly
 class TestGetActivities:
     """Test the GET /activities endpoint"""
     
-    def test_get_activities_returns_all_activities(self, client):
+    async def test_get_activities_returns_all_activities(self, client):
         """Test that all activities are returned"""
-        response = client.get("/activities")
+        response = await client.get("/activities")
         assert response.status_code == 200
         data = response.json()
         assert "Chess Club" in data
         assert "Programming Class" in data
         assert len(data) == 9
     
-    def test_get_activities_includes_participants(self, client):
+    async def test_get_activities_includes_participants(self, activities_response):
         """Test that activities include participant information"""
-        response = client.get("/activities")
-        data = response.json()
-        chess_club = data["Chess Club"]
+        chess_club = activities_response["Chess Club"]
         assert "participants" in chess_club
         assert "michael@mergington.edu" in chess_club["participants"]
     
-    def test_get_activities_includes_required_fields(self, client):
-        """Test that activities include all required fields"""
-        response = client.get("/activities")
-        data = response.json()
-        activity = data["Chess Club"]
-        assert "description" in activity
-        assert "schedule" in activity
-        assert "max_participants" in activity
-        assert "participants" in activity
+    @pytest.mark.parametrize(
+        "field", ["description", "schedule", "max_participants", "participants"]
+    )
+    async def test_get_activities_includes_required_field(self, activities_response, field):
+        """Test that activities include each required field"""
+        assert field in activities_response["Chess Club"]
 
 
 class TestSignupForActivity:
     """Test the POST /activities/{activity_name}/signup endpoint"""
     
-    def test_signup_for_activity_success(self, client):
+    async def test_signup_for_activity_success(self, client):
         """Test successful signup for an activity"""
-        response = client.post(
-            "/activities/Chess Club/signup?email=newstudent@mergington.edu"
+        response = await client.post(
+            _CHESS_SIGNUP_URL,
+            params={"email": "newstudent@mergington.edu"},
         )
         assert response.status_code == 200
         data = response.json()
         assert "Signed up" in data["message"]
         assert "newstudent@mergington.edu" in data["message"]
     
-    def test_signup_adds_participant_to_activity(self, client):
+    async def test_signup_adds_participant_to_activity(self, client):
         """Test that signup actually adds the participant"""
         email = "newstudent@mergington.edu"
-        client.post(f"/activities/Chess Club/signup?email={email}")
+        await client.post(_CHESS_SIGNUP_URL, params={"email": email})
         
-        # Verify participant was added
-        response = client.get("/activities")
+        # Verify participant was added, after the existing participants
+        response = await client.get("/activities")
         data = response.json()
-        assert email in data["Chess Club"]["participants"]
+        assert data["Chess Club"]["participants"][-1] == email
     
-    def test_signup_for_nonexistent_activity(self, client):
+    async def test_signup_for_nonexistent_activity(self, client):
         """Test signup for non-existent activity"""
-        response = client.post(
-            "/activities/Nonexistent Club/signup?email=student@mergington.edu"
+        response = await client.post(
+            "/activities/Nonexistent Club/signup",
+            params={"email": "student@mergington.edu"},
         )
         assert response.status_code == 404
         assert "Activity not found" in response.json()["detail"]
     
-    def test_signup_duplicate_participant(self, client):
+    async def test_signup_duplicate_participant(self, client):
         """Test signup with duplicate participant"""
         email = "michael@mergington.edu"  # Already in Chess Club
-        response = client.post(
-            f"/activities/Chess Club/signup?email={email}"
-        )
+        response = await client.post(_CHESS_SIGNUP_URL, params={"email": email})
         assert response.status_code == 400
         assert "already signed up" in response.json()["detail"]
 
@@ -164,60 +194,62 @@ class TestSignupForActivity:
 class TestRemoveParticipant:
     """Test the DELETE /activities/{activity_name}/participants/{email} endpoint"""
     
-    def test_remove_participant_success(self, client):
+    async def test_remove_participant_success(self, client):
         """Test successful participant removal"""
         email = "michael@mergington.edu"
-        response = client.delete(
-            f"/activities/Chess Club/participants/{email}"
-        )
+        response = await client.delete(_CHESS_PARTICIPANT_URL_TMPL.format(email=email))
         assert response.status_code == 200
         data = response.json()
         assert "Removed" in data["message"]
     
-    def test_remove_participant_removes_from_activity(self, client):
+    async def test_remove_participant_removes_from_activity(self, client):
         """Test that removal actually removes the participant"""
         email = "michael@mergington.edu"
-        client.delete(f"/activities/Chess Club/participants/{email}")
+        await client.delete(_CHESS_PARTICIPANT_URL_TMPL.format(email=email))
         
         # Verify participant was removed
-        response = client.get("/activities")
+        response = await client.get("/activities")
         data = response.json()
         assert email not in data["Chess Club"]["participants"]
     
-    def test_remove_from_nonexistent_activity(self, client):
+    async def test_remove_from_nonexistent_activity(self, client):
         """Test removal from non-existent activity"""
-        response = client.delete(
+        response = await client.delete(
             "/activities/Nonexistent Club/participants/student@mergington.edu"
         )
         assert response.status_code == 404
         assert "Activity not found" in response.json()["detail"]
     
-    def test_remove_nonexistent_participant(self, client):
+    async def test_remove_nonexistent_participant(self, client):
         """Test removal of non-existent participant"""
-        response = client.delete(
-            "/activities/Chess Club/participants/nonexistent@mergington.edu"
+        response = await client.delete(
+            _CHESS_PARTICIPANT_URL_TMPL.format(email="nonexistent@mergington.edu")
         )
         assert response.status_code == 404
         assert "Participant not found" in response.json()["detail"]
     
-    def test_remove_all_participants(self, client):
+    async def test_remove_all_participants(self, client, baseline_activities):
         """Test removing all participants from an activity"""
-        # Remove first participant
-        client.delete("/activities/Chess Club/participants/michael@mergington.edu")
-        # Remove second participant
-        client.delete("/activities/Chess Club/participants/daniel@mergington.edu")
+        emails = baseline_activities["Chess Club"]["participants"]
+        responses = await asyncio.gather(*(
+            client.delete(_CHESS_PARTICIPANT_URL_TMPL.format(email=email))
+            for email in emails
+        ))
+        assert all(response.status_code == 200 for response in responses)
         
         # Verify all removed
-        response = client.get("/activities")
+        response = await client.get("/activities")
         data = response.json()
         assert len(data["Chess Club"]["participants"]) == 0
 
 
-class TestRootEndpoint:
-    """Test the root endpoint"""
-    
-    def test_root_redirects_to_static(self, client):
-        """Test that root endpoint redirects to static HTML"""
-        response = client.get("/", follow_redirects=False)
-        assert response.status_code == 307
-        assert "/static/index.html" in response.headers["location"]
+@pytest.mark.readonly
+@pytest.mark.parametrize(
+    "path,expected_status,expected_location_substr",
+    [("/", 307, "/static/index.html")],
+)
+async def test_simple_endpoints(client, path, expected_status, expected_location_substr):
+    """Test single-shot endpoints such as the root redirect to static HTML"""
+    response = await client.get(path, follow_redirects=False)
+    assert response.status_code == expected_status
+    assert expected_location_substr in response.headers["location"]